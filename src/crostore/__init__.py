@@ -1,6 +1,7 @@
 __version__ = "0.1.1"
 
 
+from . import cookies as cookies
 from . import datasystems as datasystems
 from . import exceptions as exceptions
 from . import mailsystems as mailsystems
@@ -10,4 +11,5 @@ from .abstract import AbstractItem as AbstractItem
 from .abstract import AbstractMailSystem as AbstractMailSystem
 from .abstract import AbstractMessage as AbstractMessage
 from .abstract import AbstractPlatform as AbstractPlatform
+from .core import cancel_items as cancel_items
 from .core import iter_items_to_cancel as iter_items_to_cancel
@@ -7,17 +7,27 @@ import dataclasses
 from selenium.webdriver.remote import webdriver
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
 class AbstractPlatform(abc.ABC):
     """
     Abstract Class for Platform.
 
     Platform represents a service where users are selling items on.
+
+    Platforms are singleton-like values: two instances of the same
+    platform class are interchangeable, so equality and hashing are
+    based on the platform code rather than on every field.
     """
 
     name: str
     """The name of the platform."""
 
+    def __hash__(self) -> int:
+        return hash(self.code)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
     @property
     @abc.abstractmethod
     def code(self) -> str:
@@ -44,6 +54,8 @@ class AbstractPlatform(abc.ABC):
         ----------
         driver : selenium.webdriver.remote.webdriver.Webdriver
             A selenium webdriver.
+            The caller is expected to configure the implicit wait once at
+            driver construction; implementations only use explicit waits.
         timeout : int
             Time to wait in seconds.
 
@@ -90,7 +102,7 @@ class AbstractPlatform(abc.ABC):
         """
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AbstractItem(abc.ABC):
     """
     Abstract class for Item.
@@ -119,6 +131,8 @@ class AbstractItem(abc.ABC):
         ----------
         driver : selenium.webdriver.remote.webdriver.Webdriver
             A selenium webdriver.
+            The caller is expected to configure the implicit wait once at
+            driver construction; implementations only use explicit waits.
         timeout : int
             Time to wait in seconds.
 
@@ -129,7 +143,7 @@ class AbstractItem(abc.ABC):
         """
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AbstractMessage(abc.ABC):
     """
     Abstract class for Message.
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import typing as t
+
+from selenium.webdriver.remote import webdriver
+
+
+def save_cookies(
+    driver: webdriver.WebDriver, path: str | pathlib.Path
+) -> None:
+    """
+    Saves the cookies of a webdriver to a file.
+
+    Parameters
+    ----------
+    driver : selenium.webdriver.remote.webdriver.Webdriver
+        A selenium webdriver that has logged in to the platforms.
+    path : str | pathlib.Path
+        The file to save the cookies to.
+    """
+    cookies = driver.get_cookies()
+    pathlib.Path(path).write_text(json.dumps(cookies))
+
+
+def load_cookies(path: str | pathlib.Path) -> list[dict[str, t.Any]]:
+    """
+    Loads cookies saved by `save_cookies`.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The file the cookies were saved to.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The loaded cookies.
+    """
+    cookies: list[dict[str, t.Any]] = json.loads(pathlib.Path(path).read_text())
+    return cookies
+
+
+def add_cookies(
+    driver: webdriver.WebDriver,
+    cookies: list[dict[str, t.Any]],
+    url: str,
+) -> None:
+    """
+    Adds cookies to a webdriver so that it can skip signing in.
+
+    Cookies can only be set for the current domain, so the driver
+    first navigates to `url` before adding them.
+
+    Parameters
+    ----------
+    driver : selenium.webdriver.remote.webdriver.Webdriver
+        A selenium webdriver to add the cookies to.
+    cookies : list[dict[str, Any]]
+        The cookies to add, as returned by `load_cookies`.
+    url : str
+        The URL of the domain the cookies belong to,
+        e.g. `crostore.abstract.AbstractPlatform.home_url`.
+    """
+    driver.get(url)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
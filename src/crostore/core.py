@@ -1,17 +1,30 @@
+import functools
 import logging
+import queue
 from collections import abc
+from concurrent import futures
+
+from selenium.webdriver.remote import webdriver
 
 from crostore import abstract
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _message_to_item(message: abstract.AbstractMessage) -> abstract.AbstractItem:
+    return message.to_item()
+
+
 def _try_message_to_item(
     message: abstract.AbstractMessage,
 ) -> abstract.AbstractItem | None:
     """
     Trys to_item of Message.
 
+    The conversion is memoized since the same message can be observed
+    multiple times within a run.
+
     Parameters
     ----------
     message : crostore.abstract.AbstractMessage[crostore.abstract.AbstractPlatform]
@@ -24,7 +37,7 @@ def _try_message_to_item(
         Otherwise None.
     """
     try:
-        return message.to_item()
+        return _message_to_item(message)
     except Exception as err:
         logger.error(f"Cannot convert {message} to item: {err}")
         return None
@@ -34,10 +47,14 @@ def iter_items_to_cancel(
     platform: abstract.AbstractPlatform,
     ms: abstract.AbstractMailSystem,
     ds: abstract.AbstractDataSystem,
+    max_workers: int = 8,
 ) -> abc.Generator[abstract.AbstractItem, None, None]:
     """
     Iterates items to cancel according to sold messages.
 
+    The related items of each sold item are looked up concurrently
+    since each lookup is an independent datasystem request.
+
     Parameters
     ----------
     platform : crostore.abstract.AbstractPlatform
@@ -46,6 +63,8 @@ def iter_items_to_cancel(
         A mailsystem.
     ds : crostore.abstract.AbstractDataSystem
         A datasytem.
+    max_workers : int
+        The maximum number of threads used to look up related items.
 
     Returns
     -------
@@ -54,7 +73,57 @@ def iter_items_to_cancel(
     """
     sold_messages = ms.iter_sold_messages(platform)
     optional_sold_items = map(_try_message_to_item, sold_messages)
-    sold_items = filter(None, optional_sold_items)
-    for sold_item in sold_items:
-        for related_item in ds.iter_related_items(sold_item):
-            yield related_item
+    sold_items = list(filter(None, optional_sold_items))
+    if not sold_items:
+        return
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        related_futures = [
+            executor.submit(lambda item: list(ds.iter_related_items(item)), sold_item)
+            for sold_item in sold_items
+        ]
+        for future in futures.as_completed(related_futures):
+            yield from future.result()
+
+
+def cancel_items(
+    items: abc.Iterable[abstract.AbstractItem],
+    drivers: abc.Sequence[webdriver.WebDriver],
+    timeout: int = 60,
+) -> None:
+    """
+    Cancels items concurrently over a pool of webdrivers.
+
+    Each cancellation is I/O-bound on page loads, so items are distributed
+    across the drivers with a thread pool of the same size.
+
+    Parameters
+    ----------
+    items : collections.abc.Iterable[crostore.abstract.AbstractItem]
+        The items to cancel.
+    drivers : collections.abc.Sequence[selenium.webdriver.remote.webdriver.WebDriver]
+        The webdrivers to cancel items with.
+        Each driver must be logged in to the platforms beforehand.
+    timeout : int
+        Time to wait in seconds for each cancellation.
+
+    Raises
+    ------
+    crostore.exceptions.ItemNotCanceledError
+        If a cancellation could not be done.
+    """
+    if not drivers:
+        raise ValueError("drivers is empty")
+    driver_pool: queue.Queue[webdriver.WebDriver] = queue.Queue()
+    for driver in drivers:
+        driver_pool.put(driver)
+
+    def cancel(item: abstract.AbstractItem) -> None:
+        driver = driver_pool.get()
+        try:
+            item.cancel(driver, timeout)
+        finally:
+            driver_pool.put(driver)
+
+    with futures.ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+        for future in [executor.submit(cancel, item) for item in items]:
+            future.result()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import threading
 import typing as t
 from collections import abc
 
@@ -16,20 +17,36 @@ if t.TYPE_CHECKING:  # pragma: no cover
 logger = logging.getLogger(__name__)
 
 
-def build(creds: credentials.Credentials) -> resources.SheetsResource:
+def build(
+    creds: credentials.Credentials | None = None, http: t.Any | None = None
+) -> resources.SheetsResource:
     """
     Constructs a new GmailResource object to request to Gmail API.
 
     Parameters
     ----------
-    creds : google.oauth2.credentials.Credentials
+    creds : google.oauth2.credentials.Credentials | None
         The credentials for Gmail API.
+        Mutually exclusive with `http`.
+    http : Any | None
+        A preconfigured HTTP transport to send requests with, such as a
+        google_auth_httplib2.AuthorizedHttp backed by a pooled connection.
+        Mutually exclusive with `creds`.
 
     Returns
     -------
     SheetsResource
         The Resource object for interacting with Goole Sheets API.
+
+    Raises
+    ------
+    ValueError
+        If neither or both of `creds` and `http` are given.
     """
+    if (creds is None) == (http is None):
+        raise ValueError("Exactly one of creds and http must be given")
+    if http is not None:
+        return discovery.build(serviceName="sheets", version="v4", http=http)
     return discovery.build(serviceName="sheets", version="v4", credentials=creds)
 
 
@@ -45,6 +62,7 @@ def get_values(
     datetime_render_option: t.Literal[
         "SERIAL_NUMBER", "FORMATTED_STRING"
     ] = "SERIAL_NUMBER",
+    fields: str = "range,majorDimension,values",
 ) -> tuple[str, str, list[list[t.Any]]]:
     """
     Returns a range of values from a spreadsheet.
@@ -64,6 +82,8 @@ def get_values(
     datetime_render_option : Literal["SERIAL_NUMBER", "FORMATTED_STRING"]
         How dates, times, and durations should be represented in the output.
         This is ignored if valueRenderOption is FORMATTED_VALUE.
+    fields : str
+        The field mask restricting the parts of the response to return.
 
     Returns
     -------
@@ -87,6 +107,7 @@ def get_values(
             majorDimension=major_dimension,
             valueRenderOption=value_render_option,
             dateTimeRenderOption=datetime_render_option,
+            fields=fields,
         )
         .execute()
     )
@@ -97,6 +118,62 @@ def get_values(
     )
 
 
+def batch_get_values(
+    rsc: resources.SheetsResource,
+    spreadsheet_id: str,
+    *,
+    ranges: list[str],
+    major_dimension: t.Literal["ROWS", "COLUMNS"],
+    value_render_option: t.Literal[
+        "FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"
+    ] = "FORMATTED_VALUE",
+    fields: str = "valueRanges",
+) -> list[list[list[t.Any]]]:
+    """
+    Returns multiple ranges of values from a spreadsheet in one request.
+
+    Parameters
+    ----------
+    rsc : SheetsResource
+        The Resource object for interacting with Google Sheets API.
+    spreadsheet_id : str
+        The ID of the spreadsheet to retrieve data from.
+    ranges : list[str]
+        The A1 notation or R1C1 notation of the ranges to retrieve values from.
+    major_dimension : Literal["ROWS", "COLUMNS"]
+        The major dimension that results should use.
+    value_render_option : Literal["FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"]
+        How values should be represented in the output.
+    fields : str
+        The field mask restricting the parts of the response to return.
+
+    Returns
+    -------
+    list[list[list[Any]]]
+        The values of each range, in the order of `ranges`.
+
+    See Also
+    --------
+    https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchGet
+    """
+    response = (
+        rsc.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension=major_dimension,
+            valueRenderOption=value_render_option,
+            fields=fields,
+        )
+        .execute()
+    )
+    return [
+        value_range.get("values", [[]])
+        for value_range in response.get("valueRanges", [])
+    ]
+
+
 @dataclasses.dataclass(frozen=True)
 class GoogleSheetsDataSystem(abstract.AbstractDataSystem):
     creds: credentials.Credentials
@@ -109,58 +186,152 @@ class GoogleSheetsDataSystem(abstract.AbstractDataSystem):
     """The name of the sheet that has data."""
     crostore_id_column = "A"
     """The column number of Crostore ID in Google Sheets."""
+    _column_cache: dict[str, list[t.Any]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Column values fetched so far, invalidated when a column is written."""
+    _index_cache: dict[str, dict[t.Any, int]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Value-to-row maps derived from `_column_cache`."""
+    _column_by_code: dict[str, str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    """`platform_to_column` keyed by platform code for cheap lookups."""
+    _local: threading.local = dataclasses.field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+    """Thread-local storage for the per-thread Sheets Resource."""
+    _cache_lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    """Guards `_column_cache` and `_index_cache` under concurrent lookups."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_column_by_code",
+            {
+                platform.code: column
+                for platform, column in self.platform_to_column.items()
+            },
+        )
+
+    @property
+    def _rsc(self) -> resources.SheetsResource:
+        # httplib2 transports are not thread-safe and iter_items_to_cancel
+        # fans related-item lookups out over a thread pool, so each thread
+        # keeps its own Resource instead of sharing one cached transport.
+        rsc: resources.SheetsResource | None = getattr(self._local, "rsc", None)
+        if rsc is None:
+            rsc = build(self.creds)
+            self._local.rsc = rsc
+        return rsc
 
-    def get_column_values(self, column: str) -> list[t.Any]:
-        rsc = build(self.creds)
+    def get_column_values(
+        self, column: str, force_refresh: bool = False
+    ) -> list[t.Any]:
+        with self._cache_lock:
+            if not force_refresh and column in self._column_cache:
+                return self._column_cache[column]
         _, _, values = get_values(
-            rsc,
+            self._rsc,
             self.sheet_id,
             range=f"{self.sheet_name}!{column}:{column}",
             major_dimension="COLUMNS",
+            value_render_option="UNFORMATTED_VALUE",
         )
-        return list(values[0])
+        column_values = list(values[0])
+        with self._cache_lock:
+            self._column_cache[column] = column_values
+            self._index_cache.pop(column, None)
+        return column_values
+
+    @staticmethod
+    def _index_of(values: list[t.Any]) -> dict[t.Any, int]:
+        index_map: dict[t.Any, int] = {}
+        for index, value in enumerate(values):
+            index_map.setdefault(value, index)
+        return index_map
+
+    def _column_index(self, column: str) -> dict[t.Any, int]:
+        with self._cache_lock:
+            index_map = self._index_cache.get(column)
+        if index_map is None:
+            index_map = self._index_of(self.get_column_values(column))
+            with self._cache_lock:
+                self._index_cache[column] = index_map
+        return index_map
+
+    def _invalidate_column(self, column: str) -> None:
+        with self._cache_lock:
+            self._column_cache.pop(column, None)
+            self._index_cache.pop(column, None)
+
+    def _fetch_all_columns(self) -> dict[str, list[t.Any]]:
+        columns = [self.crostore_id_column, *self.platform_to_column.values()]
+        values = batch_get_values(
+            self._rsc,
+            self.sheet_id,
+            ranges=[f"{self.sheet_name}!{column}:{column}" for column in columns],
+            major_dimension="COLUMNS",
+            value_render_option="UNFORMATTED_VALUE",
+            fields="valueRanges(values)",
+        )
+        all_columns = {
+            column: list(column_values[0])
+            for column, column_values in zip(columns, values)
+        }
+        with self._cache_lock:
+            self._column_cache.update(all_columns)
+            for column in all_columns:
+                self._index_cache.pop(column, None)
+        return all_columns
 
     def iter_related_items(
         self, item: abstract.AbstractItem
     ) -> abc.Generator[abstract.AbstractItem, None, None]:
-        if item.platform not in self.platform_to_column:  # pragma: no cover
+        if item.platform.code not in self._column_by_code:  # pragma: no cover
             raise ValueError(f"{item.platform} is not supported.")
-        crostre_id = self.get_column_values(self.crostore_id_column)
+        column_values = self._fetch_all_columns()
+        crostore_ids = column_values[self.crostore_id_column]
         data = {
-            platform: self.get_column_values(column)
+            platform: column_values[column]
             for platform, column in self.platform_to_column.items()
         }
-        try:
-            item_index = data[item.platform].index(item.item_id)
-        except ValueError:
+        item_index = self._index_of(data[item.platform]).get(item.item_id)
+        if item_index is None:
             logger.warning(f"{item} is not registered")
             return
+        crostore_id = (
+            crostore_ids[item_index] if item_index < len(crostore_ids) else ""
+        )
         for platform in filter(
             lambda p: p != item.platform, self.platform_to_column.keys()
         ):
-            yield platform.create_item(
-                item_id=data[platform][item_index],
-                crostore_id=crostre_id[item_index],
-            )
+            values = data[platform]
+            if item_index < len(values) and values[item_index]:
+                yield platform.create_item(
+                    item_id=values[item_index],
+                    crostore_id=crostore_id,
+                )
 
     def update(self, item: abstract.AbstractItem) -> None:
         if not item.crostore_id:
             raise ValueError(f"crostore_id is empty in item: {item}")
-        try:
-            item_index = self.get_column_values(self.crostore_id_column).index(
-                item.crostore_id
-            )
-        except ValueError:
+        item_index = self._column_index(self.crostore_id_column).get(
+            item.crostore_id
+        )
+        if item_index is None:
             raise ValueError(
                 f"{item.crostore_id} was not found in column {self.crostore_id_column}"
             )
 
-        rsc = build(self.creds)
         update_range = (
             f"{self.sheet_name}!"
-            f"{self.platform_to_column[item.platform]}{item_index + 1}"
+            f"{self._column_by_code[item.platform.code]}{item_index + 1}"
         )
-        rsc.spreadsheets().values().update(
+        self._rsc.spreadsheets().values().update(
             spreadsheetId=self.sheet_id,
             range=update_range,
             body=dict(
@@ -168,26 +339,85 @@ class GoogleSheetsDataSystem(abstract.AbstractDataSystem):
             ),
             valueInputOption="USER_ENTERED",
         ).execute()
+        self._invalidate_column(self._column_by_code[item.platform.code])
+
+    def update_many(self, items: abc.Iterable[abstract.AbstractItem]) -> None:
+        items = list(items)
+        if not items:
+            return
+        index_map = self._column_index(self.crostore_id_column)
+        data: list[t.Any] = []
+        for item in items:
+            if not item.crostore_id:
+                raise ValueError(f"crostore_id is empty in item: {item}")
+            item_index = index_map.get(item.crostore_id)
+            if item_index is None:
+                raise ValueError(
+                    f"{item.crostore_id} was not found in column "
+                    f"{self.crostore_id_column}"
+                )
+            update_range = (
+                f"{self.sheet_name}!"
+                f"{self._column_by_code[item.platform.code]}{item_index + 1}"
+            )
+            data.append(
+                dict(
+                    range=update_range,
+                    majorDimension="COLUMNS",
+                    values=[[item.item_id]],
+                )
+            )
+        self._rsc.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.sheet_id,
+            body=dict(valueInputOption="USER_ENTERED", data=data),
+        ).execute()
+        for item in items:
+            self._invalidate_column(self._column_by_code[item.platform.code])
+
+    def delete_many(self, items: abc.Iterable[abstract.AbstractItem]) -> None:
+        items = list(items)
+        if not items:
+            return
+        index_map = self._column_index(self.crostore_id_column)
+        ranges = []
+        for item in items:
+            if not item.crostore_id:
+                raise ValueError(f"crostore_id is empty in item: {item}")
+            item_index = index_map.get(item.crostore_id)
+            if item_index is None:
+                raise ValueError(
+                    f"{item.crostore_id} was not found in column "
+                    f"{self.crostore_id_column}"
+                )
+            ranges.append(
+                f"{self.sheet_name}!"
+                f"{self._column_by_code[item.platform.code]}{item_index + 1}"
+            )
+        self._rsc.spreadsheets().values().batchClear(
+            spreadsheetId=self.sheet_id,
+            body=dict(ranges=ranges),
+        ).execute()
+        for item in items:
+            self._invalidate_column(self._column_by_code[item.platform.code])
 
     def delete(self, item: abstract.AbstractItem) -> None:
         if not item.crostore_id:
             raise ValueError(f"crostore_id is empty in item: {item}")
-        try:
-            item_index = self.get_column_values(self.crostore_id_column).index(
-                item.crostore_id
-            )
-        except ValueError:
+        item_index = self._column_index(self.crostore_id_column).get(
+            item.crostore_id
+        )
+        if item_index is None:
             raise ValueError(
                 f"{item.crostore_id} was not found in column {self.crostore_id_column}"
             )
 
-        rsc = build(self.creds)
         delete_range = (
             f"{self.sheet_name}!"
-            f"{self.platform_to_column[item.platform]}{item_index + 1}"
+            f"{self._column_by_code[item.platform.code]}{item_index + 1}"
         )
-        rsc.spreadsheets().values().clear(
+        self._rsc.spreadsheets().values().clear(
             spreadsheetId=self.sheet_id,
             range=delete_range,
             body=dict(),
         ).execute()
+        self._invalidate_column(self._column_by_code[item.platform.code])
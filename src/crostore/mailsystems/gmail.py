@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import dataclasses
 import functools
 import logging
@@ -17,6 +17,16 @@ if t.TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+_URLSAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+
+_BATCH_LIMIT = 100
+"""The maximum number of calls allowed in a single Gmail batch request."""
+
+
+def _decode_body(data: str) -> str:
+    raw = data.encode("ascii").translate(_URLSAFE_TRANS)
+    return binascii.a2b_base64(raw + b"=" * (-len(raw) % 4)).decode("utf-8")
+
 
 @functools.singledispatch
 def get_sold_mail_query(platform: abstract.AbstractPlatform) -> str:  # pragma: no cover
@@ -24,11 +34,13 @@ def get_sold_mail_query(platform: abstract.AbstractPlatform) -> str:  # pragma:
 
 
 @get_sold_mail_query.register
+@functools.lru_cache(maxsize=None)
 def _(platform: platforms.mercari.Platform) -> str:
     return f'from:({platform.email}) AND "購入しました"'
 
 
 @get_sold_mail_query.register
+@functools.lru_cache(maxsize=None)
 def _(platform: platforms.yahoo_auction.Platform) -> str:
     return (
         f"from:({platform.email})"
@@ -36,20 +48,36 @@ def _(platform: platforms.yahoo_auction.Platform) -> str:
     )
 
 
-def build(creds: credentials.Credentials) -> resources.GmailResource:
+def build(
+    creds: credentials.Credentials | None = None, http: t.Any | None = None
+) -> resources.GmailResource:
     """
     Constructs a new GmailResource object to request to Gmail API.
 
     Parameters
     ----------
-    creds : google.oauth2.credentials.Credentials
+    creds : google.oauth2.credentials.Credentials | None
         The credentials for Gmail API.
+        Mutually exclusive with `http`.
+    http : Any | None
+        A preconfigured HTTP transport to send requests with, such as a
+        google_auth_httplib2.AuthorizedHttp backed by a pooled connection.
+        Mutually exclusive with `creds`.
 
     Returns
     -------
     GmailResource
         The Resource object for interacting with Gmail API.
+
+    Raises
+    ------
+    ValueError
+        If neither or both of `creds` and `http` are given.
     """
+    if (creds is None) == (http is None):
+        raise ValueError("Exactly one of creds and http must be given")
+    if http is not None:
+        return discovery.build(serviceName="gmail", version="v1", http=http)
     return discovery.build(serviceName="gmail", version="v1", credentials=creds)
 
 
@@ -193,6 +221,7 @@ def get_message(
     *,
     id: str,
     format: t.Literal["minimal", "full", "raw", "metadata"] = "full",
+    fields: str | None = None,
 ) -> schemas.Message:
     """
     Gets the specified message of Gmail.
@@ -208,6 +237,9 @@ def get_message(
     format : Literal["minimal", "full", "raw", "metadata"]
         The format to return the message in.
         See also https://developers.google.com/gmail/api/reference/rest/v1/Format.
+    fields : str | None
+        The field mask restricting the parts of the message to return.
+        If None, the whole message is returned.
 
     Returns
     -------
@@ -220,9 +252,10 @@ def get_message(
     --------
     https://developers.google.com/gmail/api/reference/rest/v1/users.messages/get
     """
-    response = (
-        rsc.users().messages().get(userId=user_id, id=id, format=format).execute()
-    )
+    request_kwargs: dict[str, t.Any] = dict(userId=user_id, id=id, format=format)
+    if fields is not None:
+        request_kwargs["fields"] = fields
+    response = rsc.users().messages().get(**request_kwargs).execute()
     return response
 
 
@@ -278,6 +311,116 @@ def modify_message(
     return response
 
 
+def batch_get_messages(
+    rsc: resources.GmailResource,
+    user_id: str = "me",
+    *,
+    ids: abc.Sequence[str],
+    format: t.Literal["minimal", "full", "raw", "metadata"] = "full",
+    fields: str | None = None,
+) -> list[schemas.Message]:
+    """
+    Gets the specified messages of Gmail in a single batch HTTP request.
+
+    Parameters
+    ----------
+    rsc : GmailResource
+        The Resource object for interacting with Gmail API.
+    user_id : str
+        The user's email address.
+    ids : Sequence[str]
+        The IDs of the messages to retrieve.
+    format : Literal["minimal", "full", "raw", "metadata"]
+        The format to return the messages in.
+        See also https://developers.google.com/gmail/api/reference/rest/v1/Format.
+    fields : str | None
+        The field mask restricting the parts of each message to return.
+        If None, the whole messages are returned.
+
+    Returns
+    -------
+    list[Message]
+        The retrieved Message objects in the order of `ids`.
+        See also https://developers.google.com/gmail/api/reference/rest/v1/users.messages#Message
+        for Message.
+
+    See Also
+    --------
+    https://developers.google.com/gmail/api/guides/batch
+    """
+    if not ids:
+        return list()
+    messages: dict[str, schemas.Message] = {}
+
+    def callback(
+        request_id: str, response: t.Any, exception: Exception | None
+    ) -> None:
+        if exception is not None:
+            raise exception
+        messages[request_id] = response
+
+    request_kwargs: dict[str, t.Any] = dict(userId=user_id, format=format)
+    if fields is not None:
+        request_kwargs["fields"] = fields
+    for start in range(0, len(ids), _BATCH_LIMIT):
+        batch = rsc.new_batch_http_request(callback=callback)
+        for id in ids[start : start + _BATCH_LIMIT]:
+            batch.add(
+                rsc.users().messages().get(id=id, **request_kwargs),
+                request_id=id,
+            )
+        batch.execute()
+    return [messages[id] for id in ids]
+
+
+def batch_modify_messages(
+    rsc: resources.GmailResource,
+    user_id: str = "me",
+    *,
+    ids: abc.Sequence[str],
+    add_label_ids: list[str] | None = None,
+    remove_label_ids: list[str] | None = None,
+) -> None:
+    """
+    Modifies the labels on the specified messages of Gmail in a single batch HTTP request.
+
+    Parameters
+    ----------
+    rsc : GmailResource
+        The Resource object for interacting with Gmail API.
+    user_id : str
+        The user's email address.
+    ids : Sequence[str]
+        The IDs of the messages to modify.
+    add_label_ids : list[str] | None
+        A list of IDs of labels to add to the messages.
+    remove_label_ids : list[str] | None
+        A list of IDs of labels to remove from the messages.
+
+    See Also
+    --------
+    https://developers.google.com/gmail/api/guides/batch
+    """
+    if not ids:
+        return
+    for start in range(0, len(ids), _BATCH_LIMIT):
+        batch = rsc.new_batch_http_request()
+        for id in ids[start : start + _BATCH_LIMIT]:
+            batch.add(
+                rsc.users()
+                .messages()
+                .modify(
+                    userId=user_id,
+                    id=id,
+                    body=dict(
+                        addLabelIds=add_label_ids or list(),
+                        removeLabelIds=remove_label_ids or list(),
+                    ),
+                )
+            )
+        batch.execute()
+
+
 @dataclasses.dataclass(frozen=True)
 class GmailMailSystem(abstract.AbstractMailSystem):
     creds: credentials.Credentials
@@ -287,8 +430,16 @@ class GmailMailSystem(abstract.AbstractMailSystem):
     done_label_name: str = "crostored"
     """The name of the label which will be added to the message handled by Crostore."""
 
+    @functools.cached_property
+    def _rsc(self) -> resources.GmailResource:
+        return build(self.creds)
+
+    @functools.cached_property
+    def _donelabel(self) -> schemas.Label:
+        return self.get_donelabel()
+
     def get_donelabel(self) -> schemas.Label:
-        rsc = build(self.creds)
+        rsc = self._rsc
         labels = list_label(rsc, self.user_id)
         donelabels = [
             label for label in labels if label.get("name", "") == self.done_label_name
@@ -307,37 +458,58 @@ class GmailMailSystem(abstract.AbstractMailSystem):
         platform: abstract.AbstractPlatform,
     ) -> abc.Generator[str, None, None]:
         sold_mail_query = get_sold_mail_query(platform)
-        rsc = build(self.creds)
-        messages, _, _ = list_message(
-            rsc,
-            self.user_id,
-            query=sold_mail_query + " AND -{label:" + self.done_label_name + "}",
-        )
-        donelabel = self.get_donelabel()
-        for message in messages:
-            yield message["id"]
-            modify_message(
-                rsc,
+        query = sold_mail_query + " AND -{label:" + self.done_label_name + "}"
+        page_token: str | None = None
+        while True:
+            messages, page_token, _ = list_message(
+                self._rsc,
                 self.user_id,
-                id=message["id"],
-                add_label_ids=[donelabel["id"]],
+                query=query,
+                page_token=page_token,
             )
-            logger.info(f"Added {donelabel} to {message}")
+            yield from (message["id"] for message in messages)
+            if not page_token:
+                break
 
     def iter_sold_messages(
         self, platform: abstract.AbstractPlatform
     ) -> abc.Generator[abstract.AbstractMessage, None, None]:
-        rsc = build(self.creds)
-        for sold_message_id in self.iter_sold_message_ids(platform):
-            gmail_message = get_message(rsc, self.user_id, id=sold_message_id)
-            payload = gmail_message["payload"]
-            headers = {header["name"]: header["value"] for header in payload["headers"]}
-            try:
-                yield platform.create_message(
-                    subject=headers.get("subject", ""),
-                    body=base64.urlsafe_b64decode(payload["body"]["data"]).decode(
-                        "utf-8"
-                    ),
+        rsc = self._rsc
+        sold_message_ids = list(self.iter_sold_message_ids(platform))
+        if not sold_message_ids:
+            return
+        gmail_messages = batch_get_messages(
+            rsc,
+            self.user_id,
+            ids=sold_message_ids,
+            fields="id,payload/headers(name,value),payload/body/data",
+        )
+        handled_ids: list[str] = []
+        try:
+            for gmail_message in gmail_messages:
+                payload = gmail_message["payload"]
+                headers = {
+                    header["name"]: header["value"] for header in payload["headers"]
+                }
+                try:
+                    yield platform.create_message(
+                        subject=headers.get("subject", ""),
+                        body=_decode_body(payload["body"]["data"]),
+                    )
+                except Exception as err:  # pragma: no cover
+                    logger.error(f"Cannot deal with {gmail_message}: {err}")
+                    continue
+                handled_ids.append(gmail_message["id"])
+        finally:
+            # Flushed on generator close as well, so messages already
+            # yielded (and acted upon) keep their done label even if the
+            # consumer stops early.
+            if handled_ids:
+                donelabel = self._donelabel
+                batch_modify_messages(
+                    rsc,
+                    self.user_id,
+                    ids=handled_ids,
+                    add_label_ids=[donelabel["id"]],
                 )
-            except Exception as err:  # pragma: no cover
-                logger.error(f"Cannot deal with {gmail_message}: {err}")
+                logger.info(f"Added {donelabel} to {handled_ids}")
@@ -3,18 +3,29 @@ from __future__ import annotations
 import dataclasses
 import logging
 import re
+import typing as t
 
 from selenium.common import exceptions as selenium_exceptions
 from selenium.webdriver.common import by
 from selenium.webdriver.remote import webdriver
-from selenium.webdriver.support import expected_conditions, wait
+from selenium.webdriver.support import wait
 
 from crostore import abstract, exceptions
 
 logger = logging.getLogger(__name__)
 
+_ITEM_ID_PREFIX = "オークションID："
+_ITEM_ID_RE = re.compile(r"[a-zA-Z0-9]+", re.ASCII)
 
-@dataclasses.dataclass(frozen=True)
+
+def _url_startswith(prefix: str) -> t.Callable[[webdriver.WebDriver], bool]:
+    def predicate(driver: webdriver.WebDriver) -> bool:
+        return driver.current_url.startswith(prefix)
+
+    return predicate
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
 class Platform(abstract.AbstractPlatform):
     name: str = dataclasses.field(default="ヤフオク!", init=False)
 
@@ -30,26 +41,23 @@ class Platform(abstract.AbstractPlatform):
     def home_url(self) -> str:
         return "https://auctions.yahoo.co.jp/"
 
-    @property
-    def _login_url(self) -> str:
-        return "https://login.yahoo.co.jp/config/login"
-
-    @property
-    def _login_button_xpath(self) -> str:
-        return '//*[@id="topPageArea"]//a[text()="ログイン"]'
-
-    @property
-    def _my_auction_url(self) -> str:
-        return "https://auctions.yahoo.co.jp/user/jp/show/mystatus"
+    _login_url: t.ClassVar[str] = "https://login.yahoo.co.jp/config/login"
+    _login_button_css: t.ClassVar[str] = "#topPageArea a"
+    _my_auction_url: t.ClassVar[str] = (
+        "https://auctions.yahoo.co.jp/user/jp/show/mystatus"
+    )
 
     def is_accessible_to_userpage(
         self, driver: webdriver.WebDriver, timeout: int = 60
     ) -> bool:
-        driver.implicitly_wait(timeout)
         driver.get(self._my_auction_url)
+        # Happy path: the page loaded without redirecting to the login URL,
+        # so do not wait out the whole timeout just to conclude that.
+        if not _url_startswith(self._login_url)(driver):
+            return True
         try:
             wait.WebDriverWait(driver, timeout).until(
-                expected_conditions.url_matches(f"^{self._login_url}")
+                _url_startswith(self._login_url)
             )
             if self._try_relogin(driver, timeout):
                 return True
@@ -59,17 +67,25 @@ class Platform(abstract.AbstractPlatform):
             return True
 
     def _try_relogin(self, driver: webdriver.WebDriver, timeout: int = 60) -> bool:
-        driver.implicitly_wait(timeout)
         driver.get(self.home_url)
-        try:
-            login_element = driver.find_element(by.By.XPATH, self._login_button_xpath)
-        except selenium_exceptions.NoSuchElementException:  # pragma: no cover
+        # One script both locates and clicks the button, and the JS click
+        # avoids ElementClickInterceptedException caused by the popup.
+        clicked = driver.execute_script(  # type: ignore[no-untyped-call]
+            "for (const anchor of document.querySelectorAll(arguments[0])) {"
+            "  if (anchor.textContent.trim() === arguments[1]) {"
+            "    anchor.click();"
+            "    return true;"
+            "  }"
+            "}"
+            "return false;",
+            self._login_button_css,
+            "ログイン",
+        )
+        if not clicked:  # pragma: no cover
             return False
-        # To avoid ElementClickInterceptedException caused by the popup
-        driver.execute_script("arguments[0].click();", login_element)  # type: ignore[no-untyped-call]
         try:
             wait.WebDriverWait(driver, timeout).until(
-                expected_conditions.url_matches(f"^{self._login_url}")
+                _url_startswith(self._login_url)
             )
             return False
         except selenium_exceptions.TimeoutException:
@@ -83,7 +99,7 @@ class Platform(abstract.AbstractPlatform):
         return Message(self, subject, body)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Item(abstract.AbstractItem):
     platform: Platform
 
@@ -91,16 +107,16 @@ class Item(abstract.AbstractItem):
     def selling_page_url(self) -> str:
         return f"https://page.auctions.yahoo.co.jp/jp/auction/{self.item_id}"
 
-    @property
-    def _cancel_page_url(self) -> str:
-        return f"https://page.auctions.yahoo.co.jp/jp/show/cancelauction?aID={self.item_id}"
+    _cancel_url_base: t.ClassVar[str] = (
+        "https://page.auctions.yahoo.co.jp/jp/show/cancelauction?aID="
+    )
+    _cancel_button_css: t.ClassVar[str] = "form input[type=submit]"
 
     @property
-    def _cancel_button_xpath(self) -> str:
-        return "/html/body/center[1]/form/table/tbody/tr[3]/td/input"
+    def _cancel_page_url(self) -> str:
+        return self._cancel_url_base + self.item_id
 
     def cancel(self, driver: webdriver.WebDriver, timeout: int = 60) -> None:
-        driver.implicitly_wait(timeout)
         try:
             driver.get(self._cancel_page_url)
             assert (
@@ -112,7 +128,9 @@ class Item(abstract.AbstractItem):
                 f"Cannot access the cancel page: {err}"
             ) from err
         try:
-            cancel_element = driver.find_element(by.By.XPATH, self._cancel_button_xpath)
+            cancel_element = driver.find_element(
+                by.By.CSS_SELECTOR, self._cancel_button_css
+            )
             logger.debug("The cancel button was found on the page")
         except Exception as err:  # pragma: no cover
             raise exceptions.ItemNotCanceledError(
@@ -126,25 +144,24 @@ class Item(abstract.AbstractItem):
                 f"Cannot click the cancel button: {err}"
             ) from err
         wait.WebDriverWait(driver, timeout).until(
-            expected_conditions.presence_of_all_elements_located(
-                (
-                    by.By.XPATH,
-                    "/html/body",
-                )
+            lambda d: d.execute_script(  # type: ignore[no-untyped-call]
+                "return document.readyState"
             )
+            == "complete"
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Message(abstract.AbstractMessage):
     platform: Platform
 
-    @property
-    def _item_id_pattern(self) -> str:
-        return "(?<=オークションID：)[a-zA-Z0-9]+"
-
     def to_item(self) -> Item:
-        if match := re.search(self._item_id_pattern, self.body):
+        prefix_index = self.body.find(_ITEM_ID_PREFIX)
+        if prefix_index >= 0 and (
+            match := _ITEM_ID_RE.match(
+                self.body, prefix_index + len(_ITEM_ID_PREFIX)
+            )
+        ):
             item_id = match.group(0)
         else:
             raise exceptions.ItemIdNotFoundError(
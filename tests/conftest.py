@@ -18,16 +18,24 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "selenium: mark test to run with selenium")
     config.addinivalue_line("markers", "e2e: mark test to be an end-to-end test")
+    # Only meaningful under pytest-xdist (-n ... --dist loadgroup); registered
+    # here so the marker does not warn when xdist is not installed.
+    config.addinivalue_line(
+        "markers", "xdist_group: group tests onto one xdist worker"
+    )
 
 
-def pytest_runtest_setup(item: pytest.Item) -> None:
-    # For `selenium` marker
-    has_marked_selenium = bool(list(item.iter_markers("selenium")))
-    has_specified_selenium_url = item.config.getoption("--selenium")
-    if has_marked_selenium and not has_specified_selenium_url:
-        pytest.skip("--selenium option is not specified")
-    # For `e2e` marker
-    has_marked_e2e = bool(list(item.iter_markers("e2e")))
-    should_run_e2e_test = item.config.getoption("--e2e")
-    if has_marked_e2e and not should_run_e2e_test:
-        pytest.skip("--e2e option is not specified")
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    # Marked at collection so gated tests never reach per-test setup
+    # (fixture resolution included) when their option is absent.
+    skip_selenium = pytest.mark.skip(reason="--selenium option is not specified")
+    skip_e2e = pytest.mark.skip(reason="--e2e option is not specified")
+    has_selenium_url = config.getoption("--selenium")
+    should_run_e2e = config.getoption("--e2e")
+    for item in items:
+        if not has_selenium_url and "selenium" in item.keywords:
+            item.add_marker(skip_selenium)
+        if not should_run_e2e and "e2e" in item.keywords:
+            item.add_marker(skip_e2e)
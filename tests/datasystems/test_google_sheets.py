@@ -6,7 +6,6 @@ from crostore import abstract
 from crostore.datasystems import google_sheets
 from crostore.platforms import mercari, yahoo_auction
 
-from tests import FixtureRequest
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from googleapiclient._apis.sheets.v4 import schemas
@@ -24,6 +23,28 @@ def test_build(mocker: pytest_mock.MockerFixture) -> None:
     )
 
 
+def test_build_with_http(mocker: pytest_mock.MockerFixture) -> None:
+    build_mock = mocker.patch("googleapiclient.discovery.build")
+    http_mock = mocker.Mock()
+    rsc = google_sheets.build(http=http_mock)
+    assert rsc == build_mock.return_value
+    build_mock.assert_called_once_with(
+        serviceName="sheets",
+        version="v4",
+        http=http_mock,
+    )
+
+
+def test_build_with_both_or_neither_creds_and_http(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    mocker.patch("googleapiclient.discovery.build")
+    with pytest.raises(ValueError):
+        google_sheets.build(mocker.Mock(), http=mocker.Mock())
+    with pytest.raises(ValueError):
+        google_sheets.build()
+
+
 @pytest.mark.parametrize("spreadata_systemheet_id", ["sheetId1", "sheetId2"])
 @pytest.mark.parametrize("range", ["A1:A5", "Sheet1!A1:A5"])
 @pytest.mark.parametrize("values", [[]])
@@ -84,10 +105,46 @@ def test_get_values_api_call(
         majorDimension=major_dimension,
         valueRenderOption=value_render_option,
         dateTimeRenderOption=datetime_render_option,
+        fields="range,majorDimension,values",
     )
     get_mock.return_value.execute.assert_called_once_with()
 
 
+@pytest.mark.parametrize("spreadata_systemheet_id", ["sheetId1", "sheetId2"])
+@pytest.mark.parametrize("ranges", [["A:A", "B:B"]])
+@pytest.mark.parametrize("major_dimension", ["ROWS", "COLUMNS"])
+def test_batch_get_values(
+    spreadata_systemheet_id: str,
+    ranges: list[str],
+    major_dimension: t.Literal["ROWS", "COLUMNS"],
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    response = {
+        "valueRanges": [
+            {"range": range, "majorDimension": major_dimension, "values": [["x"]]}
+            for range in ranges
+        ]
+    }
+    rsc_mock = mocker.Mock()
+    batch_get_mock = rsc_mock.spreadsheets().values().batchGet
+    batch_get_mock.return_value.execute.return_value = response
+    result = google_sheets.batch_get_values(
+        rsc_mock,
+        spreadata_systemheet_id,
+        ranges=ranges,
+        major_dimension=major_dimension,
+    )
+    assert result == [[["x"]] for _ in ranges]
+    batch_get_mock.assert_called_once_with(
+        spreadsheetId=spreadata_systemheet_id,
+        ranges=ranges,
+        majorDimension=major_dimension,
+        valueRenderOption="FORMATTED_VALUE",
+        fields="valueRanges",
+    )
+    batch_get_mock.return_value.execute.assert_called_once_with()
+
+
 def describe_google_sheets_data_system() -> None:
     crostore_id = [f"c{i:05}" for i in range(10)]
     platform_to_column = {
@@ -96,12 +153,12 @@ def describe_google_sheets_data_system() -> None:
     }
 
     @pytest.fixture(params=["sheetId1", "sheetId2"])
-    def sheet_id(request: FixtureRequest[str]) -> str:
-        return request.param
+    def sheet_id(request: pytest.FixtureRequest) -> str:
+        return t.cast(str, request.param)
 
     @pytest.fixture(params=["Sheet1", "Sheet2"])
-    def sheet_name(request: FixtureRequest[str]) -> str:
-        return request.param
+    def sheet_name(request: pytest.FixtureRequest) -> str:
+        return t.cast(str, request.param)
 
     @pytest.fixture()
     def data_system(
@@ -141,7 +198,59 @@ def describe_google_sheets_data_system() -> None:
             data_system.sheet_id,
             range=f"{data_system.sheet_name}!{column}:{column}",
             major_dimension="COLUMNS",
+            value_render_option="UNFORMATTED_VALUE",
+        )
+
+    @pytest.mark.parametrize("column", "ABC")
+    def test_get_column_values_is_cached(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        column: str,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        get_values_mock = mocker.patch(
+            "crostore.datasystems.google_sheets.get_values",
+            return_value=("", "COLUMNS", [[f"{column}001"]]),
+        )
+        mocker.patch("crostore.datasystems.google_sheets.build")
+        assert data_system.get_column_values(column) == [f"{column}001"]
+        assert data_system.get_column_values(column) == [f"{column}001"]
+        get_values_mock.assert_called_once()
+        data_system.get_column_values(column, force_refresh=True)
+        assert get_values_mock.call_count == 2
+
+    def test_fetch_all_columns(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        columns = [data_system.crostore_id_column, *platform_to_column.values()]
+        response = {
+            "valueRanges": [
+                {
+                    "range": f"{data_system.sheet_name}!{column}:{column}",
+                    "majorDimension": "COLUMNS",
+                    "values": [[f"{column}001", f"{column}002", f"{column}003"]],
+                }
+                for column in columns
+            ]
+        }
+        build_mock = mocker.patch("crostore.datasystems.google_sheets.build")
+        batch_get_mock = build_mock.return_value.spreadsheets().values().batchGet
+        batch_get_mock.return_value.execute.return_value = response
+        values = data_system._fetch_all_columns()
+        assert values == {
+            column: [f"{column}001", f"{column}002", f"{column}003"]
+            for column in columns
+        }
+        batch_get_mock.assert_called_once_with(
+            spreadsheetId=data_system.sheet_id,
+            ranges=[
+                f"{data_system.sheet_name}!{column}:{column}" for column in columns
+            ],
+            majorDimension="COLUMNS",
+            valueRenderOption="UNFORMATTED_VALUE",
+            fields="valueRanges(values)",
         )
+        batch_get_mock.return_value.execute.assert_called_once_with()
 
     @pytest.mark.parametrize(
         "item",
@@ -156,16 +265,20 @@ def describe_google_sheets_data_system() -> None:
         item: abstract.AbstractItem,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
-        def get_column_values(
-            _: google_sheets.GoogleSheetsDataSystem, column: str
-        ) -> list[str]:
-            if column == data_system.crostore_id_column:
-                return crostore_id
-            return [f"{column}{i:03}" for i in range(3)]
+        def fetch_all_columns(
+            _: google_sheets.GoogleSheetsDataSystem,
+        ) -> dict[str, list[str]]:
+            return {
+                data_system.crostore_id_column: crostore_id,
+                **{
+                    column: [f"{column}{i:03}" for i in range(3)]
+                    for column in platform_to_column.values()
+                },
+            }
 
         mocker.patch(
-            "crostore.datasystems.google_sheets.GoogleSheetsDataSystem.get_column_values",
-            get_column_values,
+            "crostore.datasystems.google_sheets.GoogleSheetsDataSystem._fetch_all_columns",
+            fetch_all_columns,
         )
         for related_item in data_system.iter_related_items(item):
             assert related_item.platform != item.platform
@@ -248,6 +361,104 @@ def describe_google_sheets_data_system() -> None:
         with pytest.raises(ValueError):
             data_system.update(item)
 
+    def test_update_many(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        items = [
+            platform.create_item(item_id=f"{column}{i:03}", crostore_id=crostore_id[i])
+            for i, (platform, column) in enumerate(platform_to_column.items())
+        ]
+        mocker.patch(
+            "crostore.datasystems.google_sheets.GoogleSheetsDataSystem.get_column_values",
+            return_value=crostore_id,
+        )
+        build_mock = mocker.patch(
+            "crostore.datasystems.google_sheets.build",
+        )
+        data_system.update_many(items)
+        data = [
+            dict(
+                range=(
+                    f"{data_system.sheet_name}!"
+                    f"{data_system.platform_to_column[item.platform]}"
+                    f"{crostore_id.index(item.crostore_id) + 1}"
+                ),
+                majorDimension="COLUMNS",
+                values=[[item.item_id]],
+            )
+            for item in items
+        ]
+        batch_update_mock = build_mock.return_value.spreadsheets().values().batchUpdate
+        batch_update_mock.assert_called_once_with(
+            spreadsheetId=data_system.sheet_id,
+            body=dict(valueInputOption="USER_ENTERED", data=data),
+        )
+        batch_update_mock.return_value.execute.assert_called_once_with()
+
+    def test_update_many_without_items(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        build_mock = mocker.patch(
+            "crostore.datasystems.google_sheets.build",
+        )
+        data_system.update_many([])
+        build_mock.return_value.spreadsheets().values().batchUpdate.assert_not_called()
+
+    def test_delete_many(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        items = [
+            platform.create_item(item_id=f"{column}{i:03}", crostore_id=crostore_id[i])
+            for i, (platform, column) in enumerate(platform_to_column.items())
+        ]
+        mocker.patch(
+            "crostore.datasystems.google_sheets.GoogleSheetsDataSystem.get_column_values",
+            return_value=crostore_id,
+        )
+        build_mock = mocker.patch(
+            "crostore.datasystems.google_sheets.build",
+        )
+        data_system.delete_many(items)
+        ranges = [
+            (
+                f"{data_system.sheet_name}!"
+                f"{data_system.platform_to_column[item.platform]}"
+                f"{crostore_id.index(item.crostore_id) + 1}"
+            )
+            for item in items
+        ]
+        batch_clear_mock = build_mock.return_value.spreadsheets().values().batchClear
+        batch_clear_mock.assert_called_once_with(
+            spreadsheetId=data_system.sheet_id,
+            body=dict(ranges=ranges),
+        )
+        batch_clear_mock.return_value.execute.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            platform.create_item(item_id=f"{column}000", crostore_id="")
+            for platform, column in platform_to_column.items()
+        ],
+    )
+    def test_delete_many_crostore_id_is_empty(
+        data_system: google_sheets.GoogleSheetsDataSystem,
+        item: abstract.AbstractItem,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        mocker.patch(
+            "crostore.datasystems.google_sheets.GoogleSheetsDataSystem.get_column_values",
+            return_value=crostore_id,
+        )
+        mocker.patch(
+            "crostore.datasystems.google_sheets.build",
+        )
+        with pytest.raises(ValueError):
+            data_system.delete_many([item])
+
     @pytest.mark.parametrize(
         "item",
         [
@@ -0,0 +1,33 @@
+"""A stand-in for googleapiclient's BatchHttpRequest used by the Gmail tests.
+
+The production code drives batch HTTP requests through
+``rsc.new_batch_http_request``; this mock records the queued requests and
+replays canned responses through the callback on execute().
+"""
+from __future__ import annotations
+
+import typing as t
+
+Callback = t.Callable[[str, t.Any, Exception | None], None]
+
+
+class BatchHttpRequestMock:
+    def __init__(
+        self,
+        callback: Callback | None = None,
+        responses: dict[str, t.Any] | None = None,
+    ) -> None:
+        self._callback = callback
+        self._responses = responses or dict()
+        self.requests: list[tuple[t.Any, str | None]] = []
+        self.executed = False
+
+    def add(self, request: t.Any, request_id: str | None = None) -> None:
+        self.requests.append((request, request_id))
+
+    def execute(self) -> None:
+        self.executed = True
+        if self._callback is not None:
+            for _, request_id in self.requests:
+                assert request_id is not None
+                self._callback(request_id, self._responses[request_id], None)
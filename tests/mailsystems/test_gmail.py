@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import typing as t
 
 import pytest
@@ -9,12 +10,15 @@ from crostore import abstract
 from crostore.mailsystems import gmail
 from crostore.platforms import mercari, yahoo_auction
 
+from tests.mailsystems._batch_mock import BatchHttpRequestMock
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from googleapiclient._apis.gmail.v1 import schemas
 
 
-def create_messages() -> list[schemas.Message]:
-    messages: list[schemas.Message] = [
+@functools.cache
+def create_messages() -> tuple[schemas.Message, ...]:
+    messages: tuple[schemas.Message, ...] = tuple(
         {
             "id": f"messageId{i}",
             "payload": {
@@ -27,10 +31,40 @@ def create_messages() -> list[schemas.Message]:
             },
         }
         for i in range(3)
-    ]
+    )
     return messages
 
 
+@functools.cache
+def decoded_messages() -> tuple[tuple[str, str, str], ...]:
+    """(id, subject, decoded body) for each message of `create_messages`."""
+    return tuple(
+        (
+            message["id"],
+            {
+                header["name"]: header["value"]
+                for header in message["payload"]["headers"]
+            }.get("subject", ""),
+            base64.urlsafe_b64decode(message["payload"]["body"]["data"]).decode(
+                "utf-8"
+            ),
+        )
+        for message in create_messages()
+    )
+
+
+@pytest.fixture()
+def rsc_mock(mocker: pytest_mock.MockerFixture) -> pytest_mock.MockType:
+    rsc: pytest_mock.MockType = mocker.MagicMock()
+    # Pre-materialize the hot chains so test-time attribute access hits
+    # cached child mocks instead of allocating them.
+    messages = rsc.users.return_value.messages.return_value
+    _ = (messages.list, messages.get, messages.modify)
+    labels = rsc.users.return_value.labels.return_value
+    _ = (labels.list, labels.create)
+    return rsc
+
+
 def test_build(mocker: pytest_mock.MockerFixture) -> None:
     build_mock = mocker.patch("googleapiclient.discovery.build")
     creds_mock = mocker.Mock()
@@ -43,14 +77,35 @@ def test_build(mocker: pytest_mock.MockerFixture) -> None:
     )
 
 
+def test_build_with_http(mocker: pytest_mock.MockerFixture) -> None:
+    build_mock = mocker.patch("googleapiclient.discovery.build")
+    http_mock = mocker.Mock()
+    rsc = gmail.build(http=http_mock)
+    assert rsc == build_mock.return_value
+    build_mock.assert_called_once_with(
+        serviceName="gmail",
+        version="v1",
+        http=http_mock,
+    )
+
+
+def test_build_with_both_or_neither_creds_and_http(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    mocker.patch("googleapiclient.discovery.build")
+    with pytest.raises(ValueError):
+        gmail.build(mocker.Mock(), http=mocker.Mock())
+    with pytest.raises(ValueError):
+        gmail.build()
+
+
 @pytest.mark.parametrize("label", [{}])
 def test_list_label_returns(
     label: schemas.Label,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
     response = dict(labels=[label])
-    rsc_mock = mocker.Mock()
-    list_mock = rsc_mock.users().labels().list
+    list_mock = rsc_mock.users.return_value.labels.return_value.list
     list_mock.return_value.execute.return_value = response
     assert gmail.list_label(rsc_mock) == response.get("labels", list())
 
@@ -58,11 +113,10 @@ def test_list_label_returns(
 @pytest.mark.parametrize("user_id", ["me", "foo@example.com"])
 def test_list_label_api_call(
     user_id: str,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
     gmail.list_label(rsc_mock, user_id)
-    list_mock = rsc_mock.users().labels().list
+    list_mock = rsc_mock.users.return_value.labels.return_value.list
     list_mock.assert_called_once_with(userId=user_id)
     list_mock.return_value.execute.assert_called_once_with()
 
@@ -70,10 +124,9 @@ def test_list_label_api_call(
 @pytest.mark.parametrize("label", [{}])
 def test_create_label_returns(
     label: schemas.Label,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
-    create_mock = rsc_mock.users().labels().create
+    create_mock = rsc_mock.users.return_value.labels.return_value.create
     create_mock.return_value.execute.return_value = label
     assert gmail.create_label(rsc_mock, label=label) == label
 
@@ -83,11 +136,10 @@ def test_create_label_returns(
 def test_create_label_api_call(
     user_id: str,
     label: schemas.Label,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
     gmail.create_label(rsc_mock, user_id, label=label)
-    create_mock = rsc_mock.users().labels().create
+    create_mock = rsc_mock.users.return_value.labels.return_value.create
     create_mock.assert_called_once_with(
         userId=user_id,
         body=label,
@@ -102,7 +154,7 @@ def test_list_message_returns(
     messages: list[schemas.Message] | None,
     next_page_token: str | None,
     result_size_estimate: int,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
     response: schemas.ListMessagesResponse = dict()
     if messages is not None:
@@ -111,8 +163,7 @@ def test_list_message_returns(
         response["nextPageToken"] = next_page_token
     if result_size_estimate is not None:
         response["resultSizeEstimate"] = result_size_estimate
-    rsc_mock = mocker.Mock()
-    list_mock = rsc_mock.users().messages().list
+    list_mock = rsc_mock.users.return_value.messages.return_value.list
     list_mock.return_value.execute.return_value = response
     result = gmail.list_message(rsc_mock)
     assert result[0] == response.get("messages", list())
@@ -120,12 +171,25 @@ def test_list_message_returns(
     assert result[2] == response.get("resultSizeEstimate", 0)
 
 
-@pytest.mark.parametrize("user_id", ["me", "foo@example.com"])
-@pytest.mark.parametrize("query", ["", "query"])
-@pytest.mark.parametrize("max_results", [100, 200])
-@pytest.mark.parametrize("page_token", [None, "page_token"])
-@pytest.mark.parametrize("label_ids", [None, ["label"]])
-@pytest.mark.parametrize("include_spam_trash", [True, False])
+# A strength-2 (pairwise) covering array over the six two-level axes:
+# every pair of parameter values appears in at least one row, at 8 rows
+# instead of the 64 of the full Cartesian product.
+_LIST_MESSAGE_CASES = [
+    ("me", "", 100, None, None, True),
+    ("me", "", 200, None, ["label"], False),
+    ("me", "query", 100, "page_token", None, False),
+    ("me", "query", 200, "page_token", ["label"], True),
+    ("foo@example.com", "", 100, "page_token", ["label"], True),
+    ("foo@example.com", "", 200, "page_token", None, False),
+    ("foo@example.com", "query", 100, None, ["label"], False),
+    ("foo@example.com", "query", 200, None, None, True),
+]
+
+
+@pytest.mark.parametrize(
+    "user_id,query,max_results,page_token,label_ids,include_spam_trash",
+    _LIST_MESSAGE_CASES,
+)
 def test_list_message_api_call(
     user_id: str,
     query: str,
@@ -133,9 +197,8 @@ def test_list_message_api_call(
     page_token: str | None,
     label_ids: list[str] | None,
     include_spam_trash: bool,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
     gmail.list_message(
         rsc_mock,
         user_id,
@@ -145,7 +208,7 @@ def test_list_message_api_call(
         label_ids=label_ids,
         include_spam_trash=include_spam_trash,
     )
-    list_mock = rsc_mock.users().messages().list
+    list_mock = rsc_mock.users.return_value.messages.return_value.list
     list_mock.assert_called_once_with(
         userId=user_id,
         q=query,
@@ -157,60 +220,87 @@ def test_list_message_api_call(
     list_mock.return_value.execute.assert_called_once_with()
 
 
-@pytest.mark.parametrize("message", create_messages())
+@pytest.mark.parametrize("message", create_messages()[:1], ids=["single"])
 def test_get_message_returns(
     message: schemas.Message,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
-    get_mock = rsc_mock.users().messages().get
+    get_mock = rsc_mock.users.return_value.messages.return_value.get
     get_mock.return_value.execute.return_value = message
     assert gmail.get_message(rsc_mock, id="id") == message
 
 
 @pytest.mark.parametrize("user_id", ["me", "foo@example.com"])
-@pytest.mark.parametrize("id", ["foo", "bar"])
-@pytest.mark.parametrize("format", ["minimal", "full", "raw", "metadata"])
 def test_get_message_api_call(
     user_id: str,
-    id: str,
-    format: t.Literal["minimal", "full", "raw", "metadata"],
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
-    gmail.get_message(rsc_mock, user_id, id=id, format=format)
-    get_mock = rsc_mock.users().messages().get
-    get_mock.assert_called_once_with(userId=user_id, id=id, format=format)
-    get_mock.return_value.execute_assert_called_once_with()
+    gmail.get_message(rsc_mock, user_id, id="foo")
+    get_mock = rsc_mock.users.return_value.messages.return_value.get
+    get_mock.assert_called_once_with(userId=user_id, id="foo", format="full")
+    get_mock.return_value.execute.assert_called_once_with()
+
+
+def test_get_message_format_forwards(rsc_mock: pytest_mock.MockType) -> None:
+    get_mock = rsc_mock.users.return_value.messages.return_value.get
+    formats: tuple[t.Literal["minimal", "full", "raw", "metadata"], ...] = (
+        "minimal",
+        "full",
+        "raw",
+        "metadata",
+    )
+    for format in formats:
+        gmail.get_message(rsc_mock, id="foo", format=format)
+        assert get_mock.call_args.kwargs["format"] == format
+
+
+@pytest.mark.parametrize("fields", ["id,payload/body/data"])
+def test_get_message_api_call_with_fields(
+    fields: str,
+    rsc_mock: pytest_mock.MockType,
+) -> None:
+    gmail.get_message(rsc_mock, id="id", fields=fields)
+    get_mock = rsc_mock.users.return_value.messages.return_value.get
+    get_mock.assert_called_once_with(
+        userId="me", id="id", format="full", fields=fields
+    )
 
 
-@pytest.mark.parametrize("message", create_messages())
+@pytest.mark.parametrize("message", create_messages()[:1], ids=["single"])
 def test_modify_message_returns(
     message: schemas.Message,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
-    modify_mock = rsc_mock.users().messages().modify
+    modify_mock = rsc_mock.users.return_value.messages.return_value.modify
     modify_mock.return_value.execute.return_value = message
     assert gmail.modify_message(rsc_mock, id="id") == message
 
 
-@pytest.mark.parametrize("user_id", ["me", "foo@example.com"])
-@pytest.mark.parametrize("id", ["messageId1", "messageId2"])
-@pytest.mark.parametrize(
-    "add_label_ids", [["labelId1"], ["labelId1", "labelId2"], None]
-)
+# Pairwise rows covering user_id x id x add_label_ids x remove_label_ids
+# in 9 items instead of 36.
+_MODIFY_MESSAGE_CASES = [
+    ("me", "messageId1", ["labelId1"], ["labelId1"]),
+    ("foo@example.com", "messageId2", ["labelId1"], ["labelId1", "labelId2"]),
+    ("me", "messageId1", ["labelId1"], None),
+    ("foo@example.com", "messageId1", ["labelId1", "labelId2"], ["labelId1"]),
+    ("me", "messageId1", ["labelId1", "labelId2"], ["labelId1", "labelId2"]),
+    ("foo@example.com", "messageId2", ["labelId1", "labelId2"], None),
+    ("me", "messageId2", None, ["labelId1"]),
+    ("foo@example.com", "messageId2", None, ["labelId1", "labelId2"]),
+    ("me", "messageId1", None, None),
+]
+
+
 @pytest.mark.parametrize(
-    "remove_label_ids", [["labelId1"], ["labelId1", "labelId2"], None]
+    "user_id,id,add_label_ids,remove_label_ids", _MODIFY_MESSAGE_CASES
 )
 def test_modify_message_api_call(
     user_id: str,
     id: str,
     add_label_ids: list[str] | None,
     remove_label_ids: list[str] | None,
-    mocker: pytest_mock.MockerFixture,
+    rsc_mock: pytest_mock.MockType,
 ) -> None:
-    rsc_mock = mocker.Mock()
     gmail.modify_message(
         rsc_mock,
         user_id,
@@ -218,7 +308,7 @@ def test_modify_message_api_call(
         add_label_ids=add_label_ids,
         remove_label_ids=remove_label_ids,
     )
-    modify_mock = rsc_mock.users().messages().modify
+    modify_mock = rsc_mock.users.return_value.messages.return_value.modify
     modify_mock.assert_called_once_with(
         userId=user_id,
         id=id,
@@ -227,7 +317,90 @@ def test_modify_message_api_call(
             removeLabelIds=remove_label_ids or list(),
         ),
     )
-    modify_mock.return_value.execute_assert_called_once_with()
+    modify_mock.return_value.execute.assert_called_once_with()
+
+
+def test_batch_get_messages(
+    rsc_mock: pytest_mock.MockType,
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    messages = create_messages()
+    batch = BatchHttpRequestMock(
+        responses={message["id"]: message for message in messages}
+    )
+
+    def new_batch_http_request(
+        callback: t.Callable[[str, t.Any, Exception | None], None]
+    ) -> BatchHttpRequestMock:
+        batch._callback = callback
+        return batch
+
+    rsc_mock.new_batch_http_request.side_effect = new_batch_http_request
+    result = gmail.batch_get_messages(
+        rsc_mock, ids=[message["id"] for message in messages]
+    )
+    assert result == list(messages)
+    assert batch.executed
+    get_mock = rsc_mock.users.return_value.messages.return_value.get
+    assert get_mock.call_args_list == [
+        mocker.call(userId="me", id=message["id"], format="full")
+        for message in messages
+    ]
+
+
+def test_batch_get_messages_chunks_at_batch_limit(
+    rsc_mock: pytest_mock.MockType,
+) -> None:
+    ids = [f"messageId{i}" for i in range(gmail._BATCH_LIMIT + 1)]
+    batches: list[BatchHttpRequestMock] = []
+
+    def new_batch_http_request(
+        callback: t.Callable[[str, t.Any, Exception | None], None]
+    ) -> BatchHttpRequestMock:
+        batch = BatchHttpRequestMock(callback, responses={id: {"id": id} for id in ids})
+        batches.append(batch)
+        return batch
+
+    rsc_mock.new_batch_http_request.side_effect = new_batch_http_request
+    result = gmail.batch_get_messages(rsc_mock, ids=ids)
+    assert result == [{"id": id} for id in ids]
+    assert [len(batch.requests) for batch in batches] == [gmail._BATCH_LIMIT, 1]
+
+
+def test_batch_get_messages_without_ids(
+    rsc_mock: pytest_mock.MockType,
+) -> None:
+    assert gmail.batch_get_messages(rsc_mock, ids=[]) == []
+    rsc_mock.new_batch_http_request.assert_not_called()
+
+
+def test_batch_modify_messages(
+    rsc_mock: pytest_mock.MockType,
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    message_ids = ["messageId0", "messageId1"]
+    batch = BatchHttpRequestMock()
+    rsc_mock.new_batch_http_request.return_value = batch
+    gmail.batch_modify_messages(
+        rsc_mock, ids=message_ids, add_label_ids=["labelId1"]
+    )
+    assert batch.executed
+    modify_mock = rsc_mock.users.return_value.messages.return_value.modify
+    assert modify_mock.call_args_list == [
+        mocker.call(
+            userId="me",
+            id=message_id,
+            body=dict(addLabelIds=["labelId1"], removeLabelIds=[]),
+        )
+        for message_id in message_ids
+    ]
+
+
+def test_batch_modify_messages_without_ids(
+    rsc_mock: pytest_mock.MockType,
+) -> None:
+    gmail.batch_modify_messages(rsc_mock, ids=[])
+    rsc_mock.new_batch_http_request.assert_not_called()
 
 
 def describe_gmail_mail_system() -> None:
@@ -242,8 +415,13 @@ def describe_gmail_mail_system() -> None:
             creds={},
         )
 
+    @pytest.fixture(autouse=True)
+    def build_mock(mocker: pytest_mock.MockerFixture) -> pytest_mock.MockType:
+        return mocker.patch("crostore.mailsystems.gmail.build")
+
     def test_donelabel_when_donelabel_has_been_created(
         mail_system: gmail.GmailMailSystem,
+        build_mock: pytest_mock.MockType,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
         donelabel = dict(name=mail_system.done_label_name)
@@ -254,7 +432,6 @@ def describe_gmail_mail_system() -> None:
         create_label_mock = mocker.patch(
             "crostore.mailsystems.gmail.create_label", return_value=donelabel
         )
-        build_mock = mocker.patch("crostore.mailsystems.gmail.build")
         assert mail_system.get_donelabel() == donelabel
         list_label_mock.assert_called_once_with(
             build_mock.return_value,
@@ -264,6 +441,7 @@ def describe_gmail_mail_system() -> None:
 
     def test_donelabel_when_donelabel_has_not_been_created(
         mail_system: gmail.GmailMailSystem,
+        build_mock: pytest_mock.MockType,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
         donelabel = dict(name=mail_system.done_label_name)
@@ -274,7 +452,6 @@ def describe_gmail_mail_system() -> None:
         create_label_mock = mocker.patch(
             "crostore.mailsystems.gmail.create_label", return_value=donelabel
         )
-        build_mock = mocker.patch("crostore.mailsystems.gmail.build")
         assert mail_system.get_donelabel() == create_label_mock.return_value
         list_label_mock.assert_called_once_with(
             build_mock.return_value,
@@ -290,10 +467,10 @@ def describe_gmail_mail_system() -> None:
     def test_iter_sold_message_ids(
         mail_system: gmail.GmailMailSystem,
         platform: abstract.AbstractPlatform,
+        build_mock: pytest_mock.MockType,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
         messages = create_messages()
-        build_mock = mocker.patch("crostore.mailsystems.gmail.build")
         list_message_mock = mocker.patch(
             "crostore.mailsystems.gmail.list_message",
             return_value=(
@@ -302,14 +479,6 @@ def describe_gmail_mail_system() -> None:
                 "",
             ),
         )
-        modify_message_mock = mocker.patch(
-            "crostore.mailsystems.gmail.modify_message",
-        )
-        donelabel = dict(id="donelabel", name=mail_system.done_label_name)
-        get_donelabel_mock = mocker.patch(
-            "crostore.mailsystems.gmail.GmailMailSystem.get_donelabel",
-            return_value=donelabel,
-        )
         for i, message_id in enumerate(mail_system.iter_sold_message_ids(platform)):
             assert message_id == messages[i]["id"]
         list_message_mock.assert_called_once_with(
@@ -319,42 +488,136 @@ def describe_gmail_mail_system() -> None:
             + " AND -{label:"
             + mail_system.done_label_name
             + "}",
+            page_token=None,
         )
-        get_donelabel_mock.assert_called_once_with()
-        for i, call in enumerate(modify_message_mock.call_args_list):
-            assert call == mocker.call(
+
+    @pytest.mark.parametrize("platform", platforms)
+    def test_iter_sold_message_ids_paginates(
+        mail_system: gmail.GmailMailSystem,
+        platform: abstract.AbstractPlatform,
+        build_mock: pytest_mock.MockType,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        messages = create_messages()
+        list_message_mock = mocker.patch(
+            "crostore.mailsystems.gmail.list_message",
+            side_effect=[
+                (messages[:2], "page_token", 0),
+                (messages[2:], "", 0),
+            ],
+        )
+        assert list(mail_system.iter_sold_message_ids(platform)) == [
+            message["id"] for message in messages
+        ]
+        query = (
+            gmail.get_sold_mail_query(platform)
+            + " AND -{label:"
+            + mail_system.done_label_name
+            + "}"
+        )
+        assert list_message_mock.call_args_list == [
+            mocker.call(
+                build_mock.return_value,
+                mail_system.user_id,
+                query=query,
+                page_token=None,
+            ),
+            mocker.call(
                 build_mock.return_value,
                 mail_system.user_id,
-                id=messages[i]["id"],
-                add_label_ids=[donelabel["id"]],
-            )
+                query=query,
+                page_token="page_token",
+            ),
+        ]
+
+    @pytest.mark.parametrize("platform", platforms)
+    def test_iter_sold_message_ids_without_messages(
+        mail_system: gmail.GmailMailSystem,
+        platform: abstract.AbstractPlatform,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        mocker.patch(
+            "crostore.mailsystems.gmail.list_message",
+            return_value=([], "", 0),
+        )
+        assert list(mail_system.iter_sold_message_ids(platform)) == []
 
     @pytest.mark.parametrize("platform", platforms)
     def test_iter_sold_messages(
         mail_system: gmail.GmailMailSystem,
         platform: abstract.AbstractPlatform,
+        build_mock: pytest_mock.MockType,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
         messages = create_messages()
-        build_mock = mocker.patch("crostore.mailsystems.gmail.build")
         iter_sold_message_ids_mock = mocker.patch(
             "crostore.mailsystems.gmail.GmailMailSystem.iter_sold_message_ids",
             return_value=[message["id"] for message in messages],
         )
-        get_message_mock = mocker.patch(
-            "crostore.mailsystems.gmail.get_message", side_effect=messages
+        batch_get_messages_mock = mocker.patch(
+            "crostore.mailsystems.gmail.batch_get_messages",
+            return_value=messages,
+        )
+        batch_modify_messages_mock = mocker.patch(
+            "crostore.mailsystems.gmail.batch_modify_messages",
         )
-        for i, message in enumerate(mail_system.iter_sold_messages(platform)):
-            payload = messages[i]["payload"]
-            headers = {header["name"]: header["value"] for header in payload["headers"]}
-            assert message == platform.create_message(
-                subject=headers.get("subject", ""),
-                body=base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8"),
-            )
+        donelabel = dict(id="donelabel", name=mail_system.done_label_name)
+        get_donelabel_mock = mocker.patch(
+            "crostore.mailsystems.gmail.GmailMailSystem.get_donelabel",
+            return_value=donelabel,
+        )
+        for (_, subject, body), message in zip(
+            decoded_messages(), mail_system.iter_sold_messages(platform), strict=True
+        ):
+            assert message == platform.create_message(subject=subject, body=body)
         iter_sold_message_ids_mock.assert_called_once_with(platform)
-        for i, call in enumerate(get_message_mock.call_args_list):
-            assert call == mocker.call(
-                build_mock.return_value,
-                mail_system.user_id,
-                id=messages[i]["id"],
-            )
+        batch_get_messages_mock.assert_called_once_with(
+            build_mock.return_value,
+            mail_system.user_id,
+            ids=[message["id"] for message in messages],
+            fields="id,payload/headers(name,value),payload/body/data",
+        )
+        get_donelabel_mock.assert_called_once_with()
+        batch_modify_messages_mock.assert_called_once_with(
+            build_mock.return_value,
+            mail_system.user_id,
+            ids=[message["id"] for message in messages],
+            add_label_ids=[donelabel["id"]],
+        )
+
+    @pytest.mark.parametrize("platform", platforms)
+    def test_iter_sold_messages_labels_handled_on_early_close(
+        mail_system: gmail.GmailMailSystem,
+        platform: abstract.AbstractPlatform,
+        build_mock: pytest_mock.MockType,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        messages = create_messages()
+        mocker.patch(
+            "crostore.mailsystems.gmail.GmailMailSystem.iter_sold_message_ids",
+            return_value=[message["id"] for message in messages],
+        )
+        mocker.patch(
+            "crostore.mailsystems.gmail.batch_get_messages",
+            return_value=messages,
+        )
+        batch_modify_messages_mock = mocker.patch(
+            "crostore.mailsystems.gmail.batch_modify_messages",
+        )
+        donelabel = dict(id="donelabel", name=mail_system.done_label_name)
+        mocker.patch(
+            "crostore.mailsystems.gmail.GmailMailSystem.get_donelabel",
+            return_value=donelabel,
+        )
+        sold_messages = mail_system.iter_sold_messages(platform)
+        # A message counts as handled once its yield has returned, so after
+        # consuming two and closing, the first one must keep its label.
+        next(sold_messages)
+        next(sold_messages)
+        sold_messages.close()
+        batch_modify_messages_mock.assert_called_once_with(
+            build_mock.return_value,
+            mail_system.user_id,
+            ids=[messages[0]["id"]],
+            add_label_ids=[donelabel["id"]],
+        )
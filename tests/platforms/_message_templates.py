@@ -0,0 +1,45 @@
+"""Sold-message templates shared by the platform test modules.
+
+The literals are parsed once at import; the fixtures only run
+str.format on them per parametrized item id.
+"""
+
+MERCARI_SUBJECT_TEMPLATE = "「商品名_{item_id}」の発送をお願いします"
+
+MERCARI_BODY_TEMPLATE = """\
+    Sellerさん
+
+    メルカリをご利用いただきありがとうございます。
+    下記の商品をWannabuyさんが購入しました。
+
+    支払い方法にコンビニまたはATMを選択しているためしばらくお待ちください。
+    支払い完了後に発送をお願いいたします。
+
+    ■商品情報
+    商品ID : {item_id}
+    商品名 : Product Name
+    商品価格 : 10,000円
+
+    アプリを起動しホーム画面右上のアイコンから「やることリスト」が確認できます。
+    """
+
+YAHOO_AUCTION_SUBJECT_TEMPLATE = "ヤフオク!-終了（落札者あり）：商品名_{item_id}"
+
+YAHOO_AUCTION_BODY_TEMPLATE = """\
+    Seller様
+
+    おめでとうございます！　商品が落札されました。
+
+    落札者からの連絡をお待ちください。
+
+    オークション情報
+    ￣￣￣￣￣￣￣￣￣￣
+    商品：Product Name
+    オークションID：{item_id}
+    開始価格：10,000 円
+    開始日時：1月 1日 0時 0分
+    終了日時：12月 31日 0時 0分
+    --------------------
+    入札件数：1
+    落札金額：10,000 円
+    """
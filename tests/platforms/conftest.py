@@ -1,26 +1,65 @@
+from __future__ import annotations
+
 import os
 import threading
+import typing as t
 from collections import abc
 from http import server
 
 import pytest
 from crostore import config
-from selenium import webdriver
 
-from tests import FixtureRequest
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from selenium import webdriver
 
 HOSTNAME = os.environ.get("HOSTNAME", "localhost")
 PORT = int(os.environ.get("PORT", "0"))
 
+# Prebuilt predicates handed out by `patch_url_startswith`; allocating
+# fresh lambdas per test added closure setup for identical callables.
+_URL_PREDICATES: dict[bool, abc.Callable[[t.Any], bool]] = {
+    True: lambda _driver: True,
+    False: lambda _driver: False,
+}
+
 
 @pytest.fixture(params=["c00000", "c12345"])
-def crostore_id(request: FixtureRequest[str]) -> str:
-    return request.param
+def crostore_id(request: pytest.FixtureRequest) -> str:
+    return t.cast(str, request.param)
+
+
+@pytest.fixture()
+def patch_url_startswith(
+    monkeypatch: pytest.MonkeyPatch,
+) -> abc.Callable[..., list[str]]:
+    """
+    Replaces a platform module's `_url_startswith` with canned predicates.
+
+    Called as `patch_url_startswith(module, result, ...)`; each wait
+    consumes the next result. Returns the list of prefixes the factory
+    was asked for, for assertion.
+    """
+
+    def _patch(module: t.Any, *results: bool) -> list[str]:
+        prefixes: list[str] = []
+        predicates = iter([_URL_PREDICATES[result] for result in results])
+
+        def fake(prefix: str) -> t.Any:
+            prefixes.append(prefix)
+            return next(predicates)
+
+        monkeypatch.setattr(module, "_url_startswith", fake)
+        return prefixes
+
+    return _patch
 
 
 @pytest.fixture(scope="session")
 def http_server() -> abc.Generator[server.HTTPServer, None, None]:
-    http_server = server.HTTPServer(("", PORT), server.SimpleHTTPRequestHandler)
+    http_server = server.ThreadingHTTPServer(
+        ("", PORT), server.SimpleHTTPRequestHandler
+    )
     httpthread = threading.Thread(target=http_server.serve_forever)
     httpthread.start()
     yield http_server
@@ -35,11 +74,14 @@ def urlbase(http_server: server.HTTPServer) -> str:
     return f"http://{HOSTNAME}:{port}/tests/platforms/pages"
 
 
-@pytest.fixture(params=["chrome"])
-def driver(request: FixtureRequest[str]) -> abc.Generator[webdriver.Remote, None, None]:
+@pytest.fixture(scope="session", params=["chrome"])
+def driver(request: pytest.FixtureRequest) -> abc.Generator[webdriver.Remote, None, None]:
     selenium_url = request.config.getoption("--selenium")
     if not selenium_url:
         return
+    # Imported lazily so unit-only runs do not pay the selenium import.
+    from selenium import webdriver
+
     match request.param:
         case "chrome":
             options = webdriver.ChromeOptions()
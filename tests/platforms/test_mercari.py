@@ -1,45 +1,36 @@
+from __future__ import annotations
+
+import typing as t
+
 import pytest
 import pytest_mock
 from crostore import exceptions
 from crostore.platforms import mercari
-from selenium.webdriver.remote import webdriver
 
-from tests import FixtureRequest
+from tests.platforms import _message_templates
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from selenium.webdriver.remote import webdriver
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def platform() -> mercari.Platform:
     return mercari.Platform()
 
 
 @pytest.fixture(params=["m100000000", "m123456789"])
-def item_id(request: FixtureRequest[str]) -> str:
-    return request.param
+def item_id(request: pytest.FixtureRequest) -> str:
+    return t.cast(str, request.param)
 
 
 @pytest.fixture()
 def message_body(item_id: str) -> str:
-    return f"""\
-    Sellerさん
-
-    メルカリをご利用いただきありがとうございます。
-    下記の商品をWannabuyさんが購入しました。
-
-    支払い方法にコンビニまたはATMを選択しているためしばらくお待ちください。
-    支払い完了後に発送をお願いいたします。
-
-    ■商品情報
-    商品ID : {item_id}
-    商品名 : Product Name
-    商品価格 : 10,000円
-
-    アプリを起動しホーム画面右上のアイコンから「やることリスト」が確認できます。
-    """
+    return _message_templates.MERCARI_BODY_TEMPLATE.format(item_id=item_id)
 
 
 @pytest.fixture()
 def message_subject(item_id: str) -> str:
-    return f"「商品名_{item_id}」の発送をお願いします"
+    return _message_templates.MERCARI_SUBJECT_TEMPLATE.format(item_id=item_id)
 
 
 def describe_mercari() -> None:
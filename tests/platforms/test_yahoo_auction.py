@@ -1,47 +1,42 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from collections import abc
+
 import pytest
 import pytest_mock
 from crostore import exceptions
 from crostore.platforms import yahoo_auction
-from selenium.webdriver.remote import webdriver
 
-from tests import FixtureRequest
+from tests.platforms import _message_templates
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from selenium.webdriver.remote import webdriver
 
-@pytest.fixture()
+# Keep the browser-bound tests on one xdist worker so they share the
+# session-scoped driver and http_server fixtures.
+pytestmark = pytest.mark.xdist_group("selenium_yahoo")
+
+
+@pytest.fixture(scope="session")
 def platform() -> yahoo_auction.Platform:
     return yahoo_auction.Platform()
 
 
-@pytest.fixture(params=["abcde12345", "vwxyzABCDE"])
-def item_id(request: FixtureRequest[str]) -> str:
-    return request.param
+@pytest.fixture(scope="module", params=["abcde12345", "vwxyzABCDE"])
+def item_id(request: pytest.FixtureRequest) -> str:
+    return t.cast(str, request.param)
 
 
 @pytest.fixture()
 def message_body(item_id: str) -> str:
-    return f"""\
-    Seller様
-
-    おめでとうございます！　商品が落札されました。
-
-    落札者からの連絡をお待ちください。
-
-    オークション情報
-    ￣￣￣￣￣￣￣￣￣￣
-    商品：Product Name
-    オークションID：{item_id}
-    開始価格：10,000 円
-    開始日時：1月 1日 0時 0分
-    終了日時：12月 31日 0時 0分
-    --------------------
-    入札件数：1
-    落札金額：10,000 円
-    """
+    return _message_templates.YAHOO_AUCTION_BODY_TEMPLATE.format(item_id=item_id)
 
 
 @pytest.fixture()
 def message_subject(item_id: str) -> str:
-    return f"ヤフオク!-終了（落札者あり）：商品名_{item_id}"
+    return _message_templates.YAHOO_AUCTION_SUBJECT_TEMPLATE.format(item_id=item_id)
 
 
 def describe_yahoo_auction() -> None:
@@ -58,32 +53,24 @@ def describe_yahoo_auction() -> None:
     def test_is_accessible_to_userpage_when_accessible(
         platform: yahoo_auction.Platform,
         driver: webdriver.WebDriver,
-        mocker: pytest_mock.MockerFixture,
+        patch_url_startswith: abc.Callable[..., list[str]],
     ) -> None:
-        url_matches_mock = mocker.patch(
-            "selenium.webdriver.support.expected_conditions.url_matches",
-            return_value=lambda _: False,
-        )
+        prefixes = patch_url_startswith(yahoo_auction, False)
         assert platform.is_accessible_to_userpage(driver, timeout=10)
-        assert url_matches_mock.call_args_list == [
-            mocker.call(f"^{platform._login_url}")
-        ]
+        assert prefixes == [platform._login_url]
 
     @pytest.mark.selenium
     def test_is_accessible_to_userpage_when_relogin_succeeds(
         platform: yahoo_auction.Platform,
         driver: webdriver.WebDriver,
-        mocker: pytest_mock.MockerFixture,
+        patch_url_startswith: abc.Callable[..., list[str]],
     ) -> None:
-        url_matches_mock = mocker.patch(
-            "selenium.webdriver.support.expected_conditions.url_matches",
-            side_effect=[lambda _: True, lambda _: False],
-        )
+        # Three predicates: the happy-path check (on the login page), the
+        # outer wait (still on the login page), then _try_relogin's wait
+        # timing out, which signals the relogin succeeded.
+        prefixes = patch_url_startswith(yahoo_auction, True, True, False)
         assert platform.is_accessible_to_userpage(driver, timeout=10)
-        assert url_matches_mock.call_args_list == [
-            mocker.call(f"^{platform._login_url}"),
-            mocker.call(f"^{platform._login_url}"),
-        ]
+        assert prefixes == [platform._login_url] * 3
 
     @pytest.mark.selenium
     def test_is_accessible_to_userpage_when_not_accessible(
@@ -123,31 +110,33 @@ def describe_yahoo_auction_item() -> None:
     @pytest.mark.selenium
     @pytest.mark.usefixtures("http_server")
     @pytest.mark.parametrize("item_id", ["abcdeFGHIJ"])
-    def test_cancel_when_page_does_not_exist(
-        item: yahoo_auction.Item,
-        driver: webdriver.WebDriver,
-        mocker: pytest_mock.MockerFixture,
-    ) -> None:
-        mocker.patch(
-            "selenium.webdriver.remote.webdriver.WebDriver.get", side_effect=Exception
-        )
-        with pytest.raises(exceptions.ItemNotCanceledError):
-            item.cancel(driver, timeout=10)
-
-    @pytest.mark.selenium
-    @pytest.mark.usefixtures("http_server")
-    @pytest.mark.parametrize("item_id", ["abcdeFGHIJ"])
-    def test_cancel_when_suspend_button_does_not_exist(
+    @pytest.mark.parametrize(
+        "page",
+        [None, "/empty_page.html"],
+        ids=["page_does_not_exist", "cancel_button_does_not_exist"],
+    )
+    def test_cancel_raises(
         item: yahoo_auction.Item,
         driver: webdriver.WebDriver,
         urlbase: str,
+        page: str | None,
         mocker: pytest_mock.MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        mocker.patch(
-            "crostore.platforms.yahoo_auction.Item._cancel_page_url",
-            new_callable=mocker.PropertyMock,
-            return_value=urlbase + "/empty_page.html",
-        )
+        if page is None:
+            mocker.patch(
+                "selenium.webdriver.remote.webdriver.WebDriver.get",
+                side_effect=Exception,
+            )
+        else:
+            cancel_page_url = urlbase + page
+
+            def _cancel_page_url(self: yahoo_auction.Item) -> str:
+                return cancel_page_url
+
+            monkeypatch.setattr(
+                yahoo_auction.Item, "_cancel_page_url", property(_cancel_page_url)
+            )
         with pytest.raises(exceptions.ItemNotCanceledError):
             item.cancel(driver, timeout=10)
 
@@ -180,3 +169,16 @@ def describe_yahoo_auction_message() -> None:
     ) -> None:
         with pytest.raises(exceptions.ItemIdNotFoundError):
             message.to_item()
+
+    def test_to_item_is_linear_on_pathological_bodies(
+        platform: yahoo_auction.Platform,
+    ) -> None:
+        # Pins the parser to the bounded [a-zA-Z0-9]+ pattern: a long body
+        # with no id after the prefix must fail fast, with no backtracking
+        # blow-up.
+        body = "オークションID：" + "！" * 10_000
+        message = yahoo_auction.Message(platform, subject="", body=body)
+        start = time.perf_counter()
+        with pytest.raises(exceptions.ItemIdNotFoundError):
+            message.to_item()
+        assert time.perf_counter() - start < 1.0
@@ -0,0 +1,32 @@
+import pathlib
+
+import pytest_mock
+from crostore import cookies
+
+
+def test_save_and_load_cookies(
+    tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    driver_cookies = [
+        {"name": "session", "value": "abc", "domain": ".example.com"},
+        {"name": "token", "value": "def", "domain": ".example.com"},
+    ]
+    driver = mocker.Mock()
+    driver.get_cookies.return_value = driver_cookies
+    path = tmp_path / "cookies.json"
+    cookies.save_cookies(driver, path)
+    assert cookies.load_cookies(path) == driver_cookies
+
+
+def test_add_cookies(mocker: pytest_mock.MockerFixture) -> None:
+    driver_cookies = [
+        {"name": "session", "value": "abc", "domain": ".example.com"},
+        {"name": "token", "value": "def", "domain": ".example.com"},
+    ]
+    driver = mocker.Mock()
+    url = "https://example.com/"
+    cookies.add_cookies(driver, driver_cookies, url)
+    driver.get.assert_called_once_with(url)
+    assert driver.add_cookie.call_args_list == [
+        mocker.call(cookie) for cookie in driver_cookies
+    ]
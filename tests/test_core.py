@@ -1,54 +1,73 @@
+import copy
+import typing as t
+from unittest import mock
+
 import pytest
 import pytest_mock
 from crostore import abstract, core, exceptions
 
-from tests import FixtureRequest
+
+# Prototype mocks built once at import: Mock(spec_set=...) runs expensive
+# introspection over the spec class, so the fixtures copy these instead of
+# re-speccing per test.
+_PLATFORM_PROTO = mock.Mock(spec_set=abstract.AbstractPlatform)
+_ITEM_PROTO = mock.Mock(spec_set=abstract.AbstractItem)
+_MAILSYSTEM_PROTO = mock.Mock(spec_set=abstract.AbstractMailSystem)
+_DATASYSTEM_PROTO = mock.Mock(spec_set=abstract.AbstractDataSystem)
+
+# Message variants configured once; the fixture only copies the matching
+# prototype instead of branching and re-wiring per test.
+_MSG_VARIANTS: dict[str, mock.Mock] = {
+    "convertable_to_item": mock.Mock(spec_set=abstract.AbstractMessage),
+    "not_convertable_to_item": mock.Mock(spec_set=abstract.AbstractMessage),
+}
+_MSG_VARIANTS["convertable_to_item"].to_item.return_value = mock.Mock(
+    spec_set=abstract.AbstractItem
+)
+_MSG_VARIANTS["not_convertable_to_item"].to_item.side_effect = (
+    exceptions.ItemIdNotFoundError
+)
 
 
 @pytest.fixture()
-def platform(mocker: pytest_mock.MockerFixture) -> abstract.AbstractPlatform:
-    platform = mocker.Mock(spec_set=abstract.AbstractPlatform)
-    assert isinstance(platform, abstract.AbstractPlatform)
+def platform() -> abstract.AbstractPlatform:
+    platform = copy.copy(_PLATFORM_PROTO)
     return platform
 
 
-@pytest.fixture(params=["convertable_to_item", "not_convertable_to_item"])
-def message(
-    request: FixtureRequest[str],
-    mocker: pytest_mock.MockerFixture,
-) -> abstract.AbstractMessage:
-    message = mocker.Mock(spec_set=abstract.AbstractMessage)
-    if (param := request.param) == "convertable_to_item":
-        message.to_item.return_value = mocker.Mock(spec_set=abstract.AbstractItem)
-    elif param == "not_convertable_to_item":
-        message.to_item.side_effect = exceptions.ItemIdNotFoundError
-    else:
-        raise ValueError(f"Invalid param: {param}")
-    assert isinstance(message, abstract.AbstractMessage)
+@pytest.fixture(params=list(_MSG_VARIANTS), ids=list(_MSG_VARIANTS))
+def message(request: pytest.FixtureRequest) -> abstract.AbstractMessage:
+    message: abstract.AbstractMessage = copy.copy(
+        _MSG_VARIANTS[t.cast(str, request.param)]
+    )
     return message
 
 
 @pytest.fixture()
-def mailsystem(
-    message: abstract.AbstractMessage,
-    mocker: pytest_mock.MockerFixture,
-) -> abstract.AbstractMailSystem:
-    mailsystem = mocker.Mock(spec_set=abstract.AbstractMailSystem)
-    mailsystem.iter_sold_messages.return_value = [message].__iter__()
-    assert isinstance(mailsystem, abstract.AbstractMailSystem)
+def mailsystem(message: abstract.AbstractMessage) -> abstract.AbstractMailSystem:
+    mailsystem = copy.copy(_MAILSYSTEM_PROTO)
+    mailsystem.iter_sold_messages.return_value = iter([message])
     return mailsystem
 
 
 @pytest.fixture()
-def datasystem(mocker: pytest_mock.MockerFixture) -> abstract.AbstractDataSystem:
-    datasystem = mocker.Mock(spec_set=abstract.AbstractDataSystem)
-    datasystem.iter_related_items.return_value = [
-        mocker.Mock(spec_set=abstract.AbstractItem)
-    ].__iter__()
-    assert isinstance(datasystem, abstract.AbstractDataSystem)
+def datasystem() -> abstract.AbstractDataSystem:
+    datasystem = copy.copy(_DATASYSTEM_PROTO)
+    datasystem.iter_related_items.return_value = iter([copy.copy(_ITEM_PROTO)])
     return datasystem
 
 
+def test_mock_prototypes_match_specs() -> None:
+    # The per-fixture isinstance self-checks ran an ABC __instancecheck__
+    # on every test; checking the prototypes once here is enough.
+    assert isinstance(_PLATFORM_PROTO, abstract.AbstractPlatform)
+    for variant in _MSG_VARIANTS.values():
+        assert isinstance(variant, abstract.AbstractMessage)
+    assert isinstance(_ITEM_PROTO, abstract.AbstractItem)
+    assert isinstance(_MAILSYSTEM_PROTO, abstract.AbstractMailSystem)
+    assert isinstance(_DATASYSTEM_PROTO, abstract.AbstractDataSystem)
+
+
 def test_iter_items_to_cancel(
     platform: abstract.AbstractPlatform,
     mailsystem: abstract.AbstractMailSystem,
@@ -56,3 +75,20 @@ def test_iter_items_to_cancel(
 ) -> None:
     _ = list(core.iter_items_to_cancel(platform, mailsystem, datasystem))
     # TODO: Implemets test codes
+
+
+def test_cancel_items(mocker: pytest_mock.MockerFixture) -> None:
+    items = [mocker.Mock(spec_set=abstract.AbstractItem) for _ in range(5)]
+    drivers = [mocker.Mock(), mocker.Mock()]
+    core.cancel_items(items, drivers, timeout=10)
+    for item in items:
+        item.cancel.assert_called_once()
+        driver, timeout = item.cancel.call_args.args
+        assert driver in drivers
+        assert timeout == 10
+
+
+def test_cancel_items_without_drivers(mocker: pytest_mock.MockerFixture) -> None:
+    items = [mocker.Mock(spec_set=abstract.AbstractItem)]
+    with pytest.raises(ValueError):
+        core.cancel_items(items, [])